@@ -116,7 +116,7 @@ async def create_reporting_effort_item(
         existing_item = await reporting_effort_item.get_by_unique_key(
             db,
             reporting_effort_id=item_in.reporting_effort_id,
-            item_type=item_in.item_type.value if hasattr(item_in.item_type, 'value') else item_in.item_type,
+            item_type=getattr(item_in.item_type, 'value', item_in.item_type),
             item_subtype=item_in.item_subtype,
             item_code=item_in.item_code
         )
@@ -272,7 +272,7 @@ async def read_reporting_effort_items(
         for i, item in enumerate(items):
             try:
                 # Convert enum to its value
-                item_type_value = item.item_type.value if hasattr(item.item_type, 'value') else str(item.item_type)
+                item_type_value = str(getattr(item.item_type, 'value', item.item_type))
                 source_type_value = item.source_type.value if item.source_type and hasattr(item.source_type, 'value') else None
                 
                 item_dict = {
@@ -339,7 +339,7 @@ async def read_reporting_effort_item(
             "source_type": db_item.source_type.value if db_item.source_type and hasattr(db_item.source_type, 'value') else None,
             "source_id": db_item.source_id,
             "source_item_id": db_item.source_item_id,
-            "item_type": db_item.item_type.value if hasattr(db_item.item_type, 'value') else str(db_item.item_type),
+            "item_type": str(getattr(db_item.item_type, 'value', db_item.item_type)),
             "item_subtype": db_item.item_subtype,
             "item_code": db_item.item_code,
             "is_active": db_item.is_active,
@@ -385,7 +385,7 @@ async def read_items_by_reporting_effort(
                 "source_type": item.source_type.value if item.source_type and hasattr(item.source_type, 'value') else None,
                 "source_id": item.source_id,
                 "source_item_id": item.source_item_id,
-                "item_type": item.item_type.value if hasattr(item.item_type, 'value') else str(item.item_type),
+                "item_type": str(getattr(item.item_type, 'value', item.item_type)),
                 "item_subtype": item.item_subtype,
                 "item_code": item.item_code,
                 "is_active": item.is_active,
@@ -730,7 +730,7 @@ async def bulk_create_tlf_items(
                     "source_type": created_item.source_type.value if created_item.source_type else None,
                     "source_id": created_item.source_id,
                     "source_item_id": created_item.source_item_id,
-                    "item_type": created_item.item_type.value if hasattr(created_item.item_type, 'value') else str(created_item.item_type),
+                    "item_type": str(getattr(created_item.item_type, 'value', created_item.item_type)),
                     "item_subtype": created_item.item_subtype,
                     "item_code": created_item.item_code,
                     "is_active": created_item.is_active,
@@ -858,7 +858,7 @@ async def bulk_create_dataset_items(
                     "source_type": created_item.source_type.value if created_item.source_type else None,
                     "source_id": created_item.source_id,
                     "source_item_id": created_item.source_item_id,
-                    "item_type": created_item.item_type.value if hasattr(created_item.item_type, 'value') else str(created_item.item_type),
+                    "item_type": str(getattr(created_item.item_type, 'value', created_item.item_type)),
                     "item_subtype": created_item.item_subtype,
                     "item_code": created_item.item_code,
                     "is_active": created_item.is_active,
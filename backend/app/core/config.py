@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 
-from pydantic import Field
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,7 +14,13 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = Field(..., description="PostgreSQL async connection string")
-    db_pool_size: int = Field(default=10, description="Database connection pool size")
+    db_pool_size: int = Field(
+        default=10,
+        validation_alias=AliasChoices("PEARL_DB_POOL_SIZE", "DB_POOL_SIZE"),
+        description="Database connection pool size",
+    )
+    db_max_overflow: int = Field(default=20, description="Connections allowed beyond the pool size under load")
+    db_pool_recycle: int = Field(default=3600, description="Seconds before a pooled connection is replaced")
     
     # Security
     jwt_secret: str = Field(default="dev-secret-key", description="JWT secret key")
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
@@ -32,11 +32,14 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         )
         return list(result.scalars().all())
 
-    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new entity."""
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType, commit: bool = True) -> ModelType:
+        """Create a new entity; with commit=False it is only flushed into the caller's transaction."""
         obj_in_data = obj_in.model_dump() if hasattr(obj_in, 'model_dump') else obj_in.dict()
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
+        if not commit:
+            await db.flush()
+            return db_obj
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
@@ -71,5 +74,5 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     async def count(self, db: AsyncSession) -> int:
         """Count total entities."""
-        result = await db.execute(select(self.model).count())
-        return result.scalar()
\ No newline at end of file
+        result = await db.execute(select(func.count()).select_from(self.model))
+        return result.scalar_one()
\ No newline at end of file
@@ -12,15 +12,17 @@ from app.schemas.database_release import DatabaseReleaseCreate, DatabaseReleaseU
 class DatabaseReleaseCRUD:
     """CRUD operations for DatabaseRelease model."""
     
-    async def create(self, db: AsyncSession, *, obj_in: DatabaseReleaseCreate) -> DatabaseRelease:
-        """Create a new database release."""
+    async def create(self, db: AsyncSession, *, obj_in: DatabaseReleaseCreate, commit: bool = True) -> DatabaseRelease:
+        """Create a new database release; with commit=False it is only flushed."""
         db_obj = DatabaseRelease(
             study_id=obj_in.study_id,
             database_release_label=obj_in.database_release_label
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
         return db_obj
     
     async def get(self, db: AsyncSession, *, id: int) -> Optional[DatabaseRelease]:
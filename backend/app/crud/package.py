@@ -12,12 +12,14 @@ from app.schemas.package import PackageCreate, PackageUpdate
 class PackageCRUD:
     """CRUD operations for Package model."""
     
-    async def create(self, db: AsyncSession, *, obj_in: PackageCreate) -> Package:
-        """Create a new package."""
+    async def create(self, db: AsyncSession, *, obj_in: PackageCreate, commit: bool = True) -> Package:
+        """Create a new package; with commit=False it is only flushed."""
         db_obj = Package(package_name=obj_in.package_name)
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
         return db_obj
     
     async def get(self, db: AsyncSession, *, id: int) -> Optional[Package]:
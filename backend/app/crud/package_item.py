@@ -26,7 +26,7 @@ class PackageItemCRUD:
         existing = await self.get_by_unique_key(
             db,
             package_id=obj_in.package_id,
-            item_type=obj_in.item_type.value if hasattr(obj_in.item_type, 'value') else obj_in.item_type,
+            item_type=getattr(obj_in.item_type, 'value', obj_in.item_type),
             item_subtype=obj_in.item_subtype,
             item_code=obj_in.item_code
         )
@@ -52,7 +52,7 @@ class PackageItemCRUD:
         existing = await self.get_by_unique_key(
             db,
             package_id=obj_in.package_id,
-            item_type=obj_in.item_type.value if hasattr(obj_in.item_type, 'value') else obj_in.item_type,
+            item_type=getattr(obj_in.item_type, 'value', obj_in.item_type),
             item_subtype=obj_in.item_subtype,
             item_code=obj_in.item_code
         )
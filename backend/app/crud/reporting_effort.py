@@ -13,16 +13,18 @@ from app.schemas.reporting_effort import ReportingEffortCreate, ReportingEffortU
 class ReportingEffortCRUD:
     """CRUD operations for ReportingEffort model."""
     
-    async def create(self, db: AsyncSession, *, obj_in: ReportingEffortCreate) -> ReportingEffort:
-        """Create a new reporting effort."""
+    async def create(self, db: AsyncSession, *, obj_in: ReportingEffortCreate, commit: bool = True) -> ReportingEffort:
+        """Create a new reporting effort; with commit=False it is only flushed."""
         db_obj = ReportingEffort(
             study_id=obj_in.study_id,
             database_release_id=obj_in.database_release_id,
             database_release_label=obj_in.database_release_label
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
         return db_obj
     
     async def get(self, db: AsyncSession, *, id: int) -> Optional[ReportingEffort]:
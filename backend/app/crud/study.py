@@ -12,12 +12,14 @@ from app.schemas.study import StudyCreate, StudyUpdate
 class StudyCRUD:
     """CRUD operations for Study model."""
     
-    async def create(self, db: AsyncSession, *, obj_in: StudyCreate) -> Study:
-        """Create a new study."""
+    async def create(self, db: AsyncSession, *, obj_in: StudyCreate, commit: bool = True) -> Study:
+        """Create a new study; with commit=False it is only flushed."""
         db_obj = Study(study_label=obj_in.study_label)
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
         return db_obj
     
     async def get(self, db: AsyncSession, *, id: int) -> Optional[Study]:
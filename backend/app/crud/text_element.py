@@ -12,15 +12,17 @@ from app.schemas.text_element import TextElementCreate, TextElementUpdate
 class TextElementCRUD:
     """CRUD operations for TextElement model."""
     
-    async def create(self, db: AsyncSession, *, obj_in: TextElementCreate) -> TextElement:
-        """Create a new text element."""
+    async def create(self, db: AsyncSession, *, obj_in: TextElementCreate, commit: bool = True) -> TextElement:
+        """Create a new text element; with commit=False it is only flushed."""
         db_obj = TextElement(
             type=obj_in.type,
             label=obj_in.label
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
         return db_obj
     
     async def get(self, db: AsyncSession, *, id: int) -> Optional[TextElement]:
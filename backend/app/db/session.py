@@ -7,20 +7,32 @@ from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+# Pool sizing only applies to the default AsyncAdaptedQueuePool; SQLite
+# (used for local experiments) runs without a pool
+if "sqlite" in settings.database_url:
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 # Create async engine with proper configuration
 engine = create_async_engine(
     settings.database_url,
     echo=settings.env == "development",
-    pool_size=settings.db_pool_size,
-    max_overflow=20,
-    poolclass=NullPool if "sqlite" in settings.database_url else None,
     future=True,
+    **pool_options,
 )
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    # Objects stay loaded after commit (INSERT ... RETURNING already set the
+    # id), so CRUD create() methods return them without a refresh SELECT
     expire_on_commit=False,
     autoflush=False,
     autocommit=False,
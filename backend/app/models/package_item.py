@@ -1,6 +1,6 @@
 """PackageItem SQLAlchemy model."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Enum
+from sqlalchemy import CheckConstraint, Column, Integer, String, ForeignKey, UniqueConstraint, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -16,7 +16,7 @@ class PackageItem(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     package_id: Mapped[int] = mapped_column(Integer, ForeignKey("packages.id"), nullable=False, index=True)
     item_type: Mapped[ItemType] = mapped_column(
-        Enum(ItemType, native_enum=False, values_callable=lambda obj: [e.value for e in obj]),
+        Enum(ItemType, native_enum=False, length=16, values_callable=lambda obj: [e.value for e in obj]),
         nullable=False,
         index=True,
         doc="Type of package item (TLF or Dataset)"
@@ -43,6 +43,7 @@ class PackageItem(Base, TimestampMixin):
     __table_args__ = (
         UniqueConstraint('package_id', 'item_type', 'item_subtype', 'item_code', 
                         name='uq_package_item_unique'),
+        CheckConstraint("item_type IN ('TLF', 'Dataset')", name='ck_package_items_item_type'),
     )
     
     def __repr__(self) -> str:
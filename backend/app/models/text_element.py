@@ -1,6 +1,6 @@
 """TextElement SQLAlchemy model."""
 
-from sqlalchemy import String, Enum, Text
+from sqlalchemy import CheckConstraint, String, Enum, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -24,7 +24,7 @@ class TextElement(Base, TimestampMixin):
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     type: Mapped[TextElementType] = mapped_column(
-        Enum(TextElementType), 
+        Enum(TextElementType, native_enum=False, length=32),
         nullable=False, 
         index=True,
         doc="Type of text element"
@@ -39,5 +39,13 @@ class TextElement(Base, TimestampMixin):
     # package_item_footnotes = relationship("PackageItemFootnote", back_populates="footnote")
     # package_item_acronyms = relationship("PackageItemAcronym", back_populates="acronym")
     
+    # Allowed values are enforced with a CHECK constraint instead of a native enum
+    __table_args__ = (
+        CheckConstraint(
+            "type IN ('title', 'footnote', 'population_set', 'acronyms_set', 'ich_category')",
+            name='ck_text_elements_type'
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<TextElement(id={self.id}, type={self.type.value}, label='{self.label[:50]}...')>"
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""convert_enum_columns_to_varchar_check
+
+Revision ID: 5e2c9d1a7b43
+Revises: 2da21039add2
+Create Date: 2026-10-17 09:00:00.000000
+
+Replaces the native PostgreSQL enums behind text_elements.type and
+package_items.item_type with VARCHAR columns guarded by CHECK constraints.
+The column type change rewrites both tables once; after that, adding or
+removing an allowed value is a DROP/ADD CONSTRAINT ... NOT VALID followed by
+VALIDATE CONSTRAINT, which only takes a SHARE UPDATE EXCLUSIVE lock.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2c9d1a7b43'
+down_revision = '2da21039add2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # text_elements.type: textelementtype -> VARCHAR(32)
+    op.execute("ALTER TABLE text_elements ALTER COLUMN type DROP DEFAULT")
+    op.execute("ALTER TABLE text_elements ALTER COLUMN type TYPE VARCHAR(32) USING type::text")
+    op.execute("ALTER TABLE text_elements ALTER COLUMN type SET DEFAULT 'title'")
+    op.execute("""
+        ALTER TABLE text_elements ADD CONSTRAINT ck_text_elements_type
+        CHECK (type IN ('title', 'footnote', 'population_set', 'acronyms_set', 'ich_category')) NOT VALID
+    """)
+    op.execute("ALTER TABLE text_elements VALIDATE CONSTRAINT ck_text_elements_type")
+    op.execute("DROP TYPE IF EXISTS textelementtype")
+
+    # package_items.item_type: itemtype -> VARCHAR(16)
+    # (the itemtype enum itself is still used by reporting_effort_items)
+    op.execute("ALTER TABLE package_items ALTER COLUMN item_type TYPE VARCHAR(16) USING item_type::text")
+    op.execute("""
+        ALTER TABLE package_items ADD CONSTRAINT ck_package_items_item_type
+        CHECK (item_type IN ('TLF', 'Dataset')) NOT VALID
+    """)
+    op.execute("ALTER TABLE package_items VALIDATE CONSTRAINT ck_package_items_item_type")
+
+
+def downgrade() -> None:
+    # Restore package_items.item_type to the itemtype enum
+    op.drop_constraint('ck_package_items_item_type', 'package_items', type_='check')
+    op.execute("ALTER TABLE package_items ALTER COLUMN item_type TYPE itemtype USING item_type::itemtype")
+
+    # Recreate textelementtype and restore text_elements.type
+    op.drop_constraint('ck_text_elements_type', 'text_elements', type_='check')
+    op.execute("CREATE TYPE textelementtype AS ENUM ('title', 'footnote', 'population_set', 'acronyms_set', 'ich_category')")
+    op.execute("ALTER TABLE text_elements ALTER COLUMN type DROP DEFAULT")
+    op.execute("ALTER TABLE text_elements ALTER COLUMN type TYPE textelementtype USING type::textelementtype")
+    op.execute("ALTER TABLE text_elements ALTER COLUMN type SET DEFAULT 'title'")
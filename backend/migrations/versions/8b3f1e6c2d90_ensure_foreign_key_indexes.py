@@ -0,0 +1,61 @@
+"""ensure_foreign_key_indexes
+
+Revision ID: 8b3f1e6c2d90
+Revises: 5e2c9d1a7b43
+Create Date: 2026-10-17 12:00:00.000000
+
+Makes sure the foreign key columns followed by the study cascade-delete path
+are indexed. The models declare these with index=True, but databases whose
+early tables were created outside of Alembic (database_releases has no
+creating revision) may be missing some of them. Indexes are built
+CONCURRENTLY so existing tables stay writable, and IF NOT EXISTS makes the
+revision a no-op where a valid index is already present; INVALID leftovers
+from an interrupted build are dropped and rebuilt.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b3f1e6c2d90'
+down_revision = '5e2c9d1a7b43'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column)
+FOREIGN_KEY_INDEXES = (
+    ('ix_database_releases_study_id', 'database_releases', 'study_id'),
+    ('ix_reporting_efforts_study_id', 'reporting_efforts', 'study_id'),
+    ('ix_reporting_effort_items_reporting_effort_id', 'reporting_effort_items', 'reporting_effort_id'),
+    ('ix_reporting_effort_item_tracker_reporting_effort_item_id', 'reporting_effort_item_tracker', 'reporting_effort_item_id'),
+    ('ix_package_items_package_id', 'package_items', 'package_id'),
+)
+
+
+def _drop_invalid_index(index_name: str) -> None:
+    """Drop an index left INVALID by an interrupted CREATE INDEX CONCURRENTLY.
+
+    IF NOT EXISTS would otherwise treat the leftover as present and skip the
+    build. Must be called inside an autocommit block.
+    """
+    invalid = op.get_bind().execute(sa.text("""
+        SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = :index_name AND NOT i.indisvalid
+    """), {"index_name": index_name}).first()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, table, column in FOREIGN_KEY_INDEXES:
+            _drop_invalid_index(index_name)
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} ({column})")
+
+
+def downgrade() -> None:
+    # The indexes are part of the model definitions and most of them were
+    # created by earlier revisions, so they are intentionally left in place
+    pass
@@ -17,6 +17,54 @@ down_revision = 'add_cascade_delete_constraints'
 branch_labels = None
 depends_on = None
 
+# Rows renamed per UPDATE while de-duplicating existing study labels
+DEDUP_BATCH_SIZE = 1000
+
+# studies.study_label is VARCHAR(255)
+STUDY_LABEL_MAX_LENGTH = 255
+
+
+def _deduplicate_study_labels() -> None:
+    """
+    Rename duplicate study labels so the unique index can be built.
+
+    The oldest study keeps its label; every later duplicate gets its id
+    appended, e.g. "Study A (42)", with the label truncated as needed to
+    stay within the column length. Updates run in autocommit batches so
+    row locks are released between batches.
+    """
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT study_label, COUNT(*) FROM studies
+        GROUP BY study_label
+        HAVING COUNT(*) > 1
+    """)).fetchall()
+    if not duplicates:
+        return
+    
+    print(f"  - Found {len(duplicates)} duplicated study labels, renaming extra rows")
+    renamed = 0
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            batch = bind.execute(sa.text("""
+                UPDATE studies
+                SET study_label = left(study_label, :max_length - length(' (' || id || ')')) || ' (' || id || ')'
+                WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (PARTITION BY study_label ORDER BY id) AS rn
+                        FROM studies
+                    ) ranked
+                    WHERE rn > 1
+                    LIMIT :batch_size
+                )
+                RETURNING id
+            """), {"batch_size": DEDUP_BATCH_SIZE, "max_length": STUDY_LABEL_MAX_LENGTH}).fetchall()
+            if not batch:
+                break
+            renamed += len(batch)
+    print(f"  - Renamed {renamed} studies")
+
+
 def upgrade() -> None:
     """
     Add UNIQUE constraint on study_label column.
@@ -24,12 +72,25 @@ def upgrade() -> None:
     
     print("🛡️ Adding UNIQUE constraint on study_label...")
     
-    # Add unique constraint on study_label
+    _deduplicate_study_labels()
+    
+    # Build the backing index CONCURRENTLY so studies stays writable during
+    # the scan, then attach it as the constraint (a catalog-only change).
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    # A failed or cancelled concurrent build leaves an INVALID index behind,
+    # which USING INDEX rejects, so drop any leftover before building.
+    print("  - Building unique index on studies.study_label (CONCURRENTLY)")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_studies_study_label_idx")
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_studies_study_label_idx "
+            "ON studies (study_label)"
+        )
+
     print("  - Adding UNIQUE constraint on studies.study_label")
-    op.create_unique_constraint(
-        'uq_studies_study_label',  # constraint name
-        'studies',                 # table name
-        ['study_label']           # column(s)
+    op.execute(
+        "ALTER TABLE studies ADD CONSTRAINT uq_studies_study_label "
+        "UNIQUE USING INDEX uq_studies_study_label_idx"
     )
     
     print("✅ UNIQUE constraint added successfully!")
@@ -30,13 +30,8 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    # Create enum with population_set for rollback
-    old_textelementtype = postgresql.ENUM('title', 'footnote', 'population_set', name='textelementtype_new')
-    old_textelementtype.create(op.get_bind())
-    
-    # Alter column to use old enum
-    op.execute("ALTER TABLE text_elements ALTER COLUMN type TYPE textelementtype_new USING type::text::textelementtype_new")
-    
-    # Drop new enum and rename old one
-    op.execute("DROP TYPE textelementtype")
-    op.execute("ALTER TYPE textelementtype_new RENAME TO textelementtype")
\ No newline at end of file
+    # Adding an enum value is a metadata-only change, so there is no need to
+    # rebuild the type and rewrite every text_elements row. ADD VALUE must run
+    # outside a transaction block on PostgreSQL < 12.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE textelementtype ADD VALUE IF NOT EXISTS 'population_set'")
@@ -16,31 +16,33 @@ branch_labels = None
 depends_on = None
 
 
+def _drop_invalid_index(index_name: str) -> None:
+    """Drop an index left INVALID by an interrupted CREATE INDEX CONCURRENTLY.
+
+    IF NOT EXISTS would otherwise treat the leftover as present and skip the
+    build. Must be called inside an autocommit block.
+    """
+    invalid = op.get_bind().execute(sa.text("""
+        SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = :index_name AND NOT i.indisvalid
+    """), {"index_name": index_name}).first()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
 def upgrade() -> None:
     # Drop key_value_pairs table and related enum
     op.execute("DROP TABLE IF EXISTS key_value_pairs CASCADE")
     op.execute("DROP TYPE IF EXISTS keyvaluetype CASCADE")
     
-    # Drop and recreate text_elements table with expanded enum
-    op.execute("DROP TABLE IF EXISTS text_elements CASCADE")
-    op.execute("DROP TYPE IF EXISTS textelementtype CASCADE")
-    
-    # Create new enum type with all four values
-    op.execute("CREATE TYPE textelementtype AS ENUM ('title', 'footnote', 'population_set', 'acronyms_set')")
-    
-    # Recreate text_elements table with expanded enum
-    op.execute("""
-        CREATE TABLE text_elements (
-            id SERIAL PRIMARY KEY,
-            type textelementtype NOT NULL DEFAULT 'title',
-            label TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
-        )
-    """)
-    
-    # Create indexes
-    op.execute("CREATE INDEX IF NOT EXISTS ix_text_elements_type ON text_elements (type)")
+    # Extend the existing enum in place instead of dropping and recreating
+    # text_elements, so existing rows and dependent foreign keys survive.
+    # ADD VALUE and CREATE INDEX CONCURRENTLY cannot run in a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE textelementtype ADD VALUE IF NOT EXISTS 'population_set'")
+        op.execute("ALTER TYPE textelementtype ADD VALUE IF NOT EXISTS 'acronyms_set'")
+        _drop_invalid_index("ix_text_elements_type")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_text_elements_type ON text_elements (type)")
 
 
 def downgrade() -> None:
@@ -20,38 +20,43 @@ def upgrade() -> None:
     # Create comment type enum (only if it doesn't exist)
     op.execute("DO $$ BEGIN CREATE TYPE commenttype AS ENUM ('qc_comment', 'prod_comment', 'biostat_comment'); EXCEPTION WHEN duplicate_object THEN null; END $$;")
     
-    # Create tracker_comments table manually to avoid enum creation issues
+    # Create tracker_comments table manually to avoid enum creation issues.
+    # The table and its indexes are created in one DO block so they go to the
+    # server as a single statement (asyncpg prepares statements, so a plain
+    # multi-statement string is not an option).
     op.execute("""
-        CREATE TABLE IF NOT EXISTS tracker_comments (
-            id SERIAL PRIMARY KEY,
-            tracker_id INTEGER NOT NULL,
-            user_id INTEGER NOT NULL,
-            parent_comment_id INTEGER,
-            comment_text TEXT NOT NULL,
-            comment_type commenttype NOT NULL,
-            is_resolved BOOLEAN NOT NULL DEFAULT false,
-            is_pinned BOOLEAN NOT NULL DEFAULT false,
-            is_tracked BOOLEAN NOT NULL DEFAULT false,
-            is_deleted BOOLEAN NOT NULL DEFAULT false,
-            resolved_by_user_id INTEGER,
-            resolved_at TIMESTAMP WITH TIME ZONE,
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
-            FOREIGN KEY (parent_comment_id) REFERENCES tracker_comments(id) ON DELETE CASCADE,
-            FOREIGN KEY (resolved_by_user_id) REFERENCES users(id),
-            FOREIGN KEY (tracker_id) REFERENCES reporting_effort_item_tracker(id) ON DELETE CASCADE,
-            FOREIGN KEY (user_id) REFERENCES users(id)
-        )
+        DO $$ BEGIN
+            CREATE TABLE IF NOT EXISTS tracker_comments (
+                id SERIAL PRIMARY KEY,
+                tracker_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                parent_comment_id INTEGER,
+                comment_text TEXT NOT NULL,
+                comment_type commenttype NOT NULL,
+                is_resolved BOOLEAN NOT NULL DEFAULT false,
+                is_pinned BOOLEAN NOT NULL DEFAULT false,
+                is_tracked BOOLEAN NOT NULL DEFAULT false,
+                is_deleted BOOLEAN NOT NULL DEFAULT false,
+                resolved_by_user_id INTEGER,
+                resolved_at TIMESTAMP WITH TIME ZONE,
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                FOREIGN KEY (parent_comment_id) REFERENCES tracker_comments(id) ON DELETE CASCADE,
+                FOREIGN KEY (resolved_by_user_id) REFERENCES users(id),
+                FOREIGN KEY (tracker_id) REFERENCES reporting_effort_item_tracker(id) ON DELETE CASCADE,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            );
+            
+            -- Indexes for performance
+            CREATE INDEX IF NOT EXISTS ix_tracker_comments_tracker_id ON tracker_comments (tracker_id);
+            CREATE INDEX IF NOT EXISTS ix_tracker_comments_user_id ON tracker_comments (user_id);
+            CREATE INDEX IF NOT EXISTS ix_tracker_comments_comment_type ON tracker_comments (comment_type);
+            CREATE INDEX IF NOT EXISTS ix_tracker_comments_parent_comment_id ON tracker_comments (parent_comment_id);
+            CREATE INDEX IF NOT EXISTS ix_tracker_comments_created_at ON tracker_comments (created_at);
+            CREATE INDEX IF NOT EXISTS ix_tracker_comments_is_resolved ON tracker_comments (is_resolved);
+            CREATE INDEX IF NOT EXISTS ix_tracker_comments_is_pinned ON tracker_comments (is_pinned);
+        END $$;
     """)
-    
-    # Create indexes for performance
-    op.create_index('ix_tracker_comments_tracker_id', 'tracker_comments', ['tracker_id'])
-    op.create_index('ix_tracker_comments_user_id', 'tracker_comments', ['user_id'])
-    op.create_index('ix_tracker_comments_comment_type', 'tracker_comments', ['comment_type'])
-    op.create_index('ix_tracker_comments_parent_comment_id', 'tracker_comments', ['parent_comment_id'])
-    op.create_index('ix_tracker_comments_created_at', 'tracker_comments', ['created_at'])
-    op.create_index('ix_tracker_comments_is_resolved', 'tracker_comments', ['is_resolved'])
-    op.create_index('ix_tracker_comments_is_pinned', 'tracker_comments', ['is_pinned'])
 
 
 def downgrade() -> None:
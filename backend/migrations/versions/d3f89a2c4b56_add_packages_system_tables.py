@@ -15,6 +15,22 @@ down_revision = 'c7087c378307'
 branch_labels = None
 depends_on = None
 
+# (table, column, referenced table) for every foreign key created below.
+# Constraint names follow PostgreSQL's <table>_<column>_fkey default, which
+# later revisions rely on when dropping/recreating these constraints.
+FOREIGN_KEYS = (
+    ('package_items', 'package_id', 'packages'),
+    ('package_items', 'study_id', 'studies'),
+    ('package_tlf_details', 'package_item_id', 'package_items'),
+    ('package_tlf_details', 'title_id', 'text_elements'),
+    ('package_tlf_details', 'population_flag_id', 'text_elements'),
+    ('package_dataset_details', 'package_item_id', 'package_items'),
+    ('package_item_footnotes', 'package_item_id', 'package_items'),
+    ('package_item_footnotes', 'footnote_id', 'text_elements'),
+    ('package_item_acronyms', 'package_item_id', 'package_items'),
+    ('package_item_acronyms', 'acronym_id', 'text_elements'),
+)
+
 
 def upgrade() -> None:
     # Create packages table
@@ -37,8 +53,6 @@ def upgrade() -> None:
         sa.Column('item_code', sa.String(length=255), nullable=False),
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.ForeignKeyConstraint(['package_id'], ['packages.id'], ),
-        sa.ForeignKeyConstraint(['study_id'], ['studies.id'], ),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('package_id', 'item_type', 'item_subtype', 'item_code', name='uq_package_item_unique')
     )
@@ -52,12 +66,9 @@ def upgrade() -> None:
         sa.Column('package_item_id', sa.Integer(), nullable=False),
         sa.Column('title_id', sa.Integer(), nullable=True),
         sa.Column('population_flag_id', sa.Integer(), nullable=True),
-        sa.ForeignKeyConstraint(['package_item_id'], ['package_items.id'], ),
-        sa.ForeignKeyConstraint(['title_id'], ['text_elements.id'], ),
-        sa.ForeignKeyConstraint(['population_flag_id'], ['text_elements.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('package_item_id', name='uq_package_tlf_details_package_item_id')
     )
-    op.create_index(op.f('ix_package_tlf_details_package_item_id'), 'package_tlf_details', ['package_item_id'], unique=True)
     
     # Create package_dataset_details table
     op.create_table('package_dataset_details',
@@ -66,18 +77,15 @@ def upgrade() -> None:
         sa.Column('label', sa.String(length=255), nullable=True),
         sa.Column('sorting_order', sa.Integer(), nullable=True),
         sa.Column('acronyms', sa.Text(), nullable=True),
-        sa.ForeignKeyConstraint(['package_item_id'], ['package_items.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('package_item_id', name='uq_package_dataset_details_package_item_id')
     )
-    op.create_index(op.f('ix_package_dataset_details_package_item_id'), 'package_dataset_details', ['package_item_id'], unique=True)
     
     # Create package_item_footnotes junction table
     op.create_table('package_item_footnotes',
         sa.Column('package_item_id', sa.Integer(), nullable=False),
         sa.Column('footnote_id', sa.Integer(), nullable=False),
         sa.Column('sequence_number', sa.Integer(), nullable=True),
-        sa.ForeignKeyConstraint(['package_item_id'], ['package_items.id'], ),
-        sa.ForeignKeyConstraint(['footnote_id'], ['text_elements.id'], ),
         sa.PrimaryKeyConstraint('package_item_id', 'footnote_id')
     )
     
@@ -85,19 +93,29 @@ def upgrade() -> None:
     op.create_table('package_item_acronyms',
         sa.Column('package_item_id', sa.Integer(), nullable=False),
         sa.Column('acronym_id', sa.Integer(), nullable=False),
-        sa.ForeignKeyConstraint(['package_item_id'], ['package_items.id'], ),
-        sa.ForeignKeyConstraint(['acronym_id'], ['text_elements.id'], ),
         sa.PrimaryKeyConstraint('package_item_id', 'acronym_id')
     )
+    
+    # Add foreign keys as NOT VALID so the referenced tables (studies,
+    # text_elements, ...) are not scanned while the migration holds its locks
+    for table, column, referenced_table in FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {referenced_table}(id) NOT VALID"
+        )
+    
+    # Validate outside the migration transaction; VALIDATE CONSTRAINT only
+    # takes a SHARE UPDATE EXCLUSIVE lock
+    with op.get_context().autocommit_block():
+        for table, column, _ in FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_{column}_fkey")
 
 
 def downgrade() -> None:
     # Drop tables in reverse order of creation
     op.drop_table('package_item_acronyms')
     op.drop_table('package_item_footnotes')
-    op.drop_index(op.f('ix_package_dataset_details_package_item_id'), table_name='package_dataset_details')
     op.drop_table('package_dataset_details')
-    op.drop_index(op.f('ix_package_tlf_details_package_item_id'), table_name='package_tlf_details')
     op.drop_table('package_tlf_details')
     op.drop_index(op.f('ix_package_items_study_id'), table_name='package_items')
     op.drop_index(op.f('ix_package_items_package_id'), table_name='package_items')
@@ -17,8 +17,21 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Drop is_deleted column from tracker_comments table
-    op.drop_column('tracker_comments', 'is_deleted')
+    # Run outside a transaction so the timeouts apply per statement and the
+    # index can be dropped CONCURRENTLY. Failing fast on lock_timeout is
+    # better than queueing behind long-running queries on a busy database.
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = '5s'")
+        op.execute("SET statement_timeout = '30s'")
+        
+        # Drop any index on is_deleted first; DROP COLUMN itself is metadata-only
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tracker_comments_is_deleted")
+        
+        # Drop is_deleted column from tracker_comments table
+        op.execute("ALTER TABLE tracker_comments DROP COLUMN IF EXISTS is_deleted")
+        
+        op.execute("RESET statement_timeout")
+        op.execute("RESET lock_timeout")
 
 
 def downgrade() -> None:
@@ -7,7 +7,7 @@ Removes all existing users and creates three test users:
 """
 
 import asyncio
-from sqlalchemy import select, delete, text, update
+from sqlalchemy import select, delete, insert, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import AsyncSessionLocal, engine
@@ -22,12 +22,15 @@ async def reset_users():
             # First, clear or delete records that reference users
             print("Clearing user references in related tables...")
             
-            # Delete tracker comments (user_id is NOT NULL, so we can't set it to NULL)
-            # Comments will be recreated as needed with new users
-            comments_deleted = await session.execute(
-                text("DELETE FROM tracker_comments")
+            # Remove all tracker comments (user_id is NOT NULL, so we can't set it to NULL)
+            # Comments will be recreated as needed with new users. TRUNCATE drops
+            # the table contents in one step instead of deleting row by row.
+            # users itself is not truncated: TRUNCATE ... CASCADE would also wipe
+            # reporting_effort_item_tracker and audit_log, which reference users.
+            await session.execute(
+                text("TRUNCATE TABLE tracker_comments RESTART IDENTITY")
             )
-            print(f"  - Deleted {comments_deleted.rowcount} comment(s)")
+            print("  - Truncated tracker comments")
             
             # Clear production_programmer_id and qc_programmer_id in tracker table
             await session.execute(
@@ -38,15 +41,12 @@ async def reset_users():
             await session.execute(
                 text("UPDATE audit_log SET user_id = NULL")
             )
-            
-            await session.commit()
             print("Cleared user references")
             
             # Now delete all existing users
             print("Deleting all existing users...")
             result = await session.execute(delete(User))
             deleted_count = result.rowcount
-            await session.commit()
             print(f"Deleted {deleted_count} user(s)")
             
             # Create test users
@@ -72,19 +72,23 @@ async def reset_users():
             ]
             
             print("\nCreating test users...")
-            for user_data in test_users:
-                password_hash = get_password_hash(user_data["password"])
-                user = User(
-                    username=user_data["username"],
-                    email=user_data["email"],
-                    password_hash=password_hash,
-                    role=user_data["role"],
-                    auth_provider=AuthProvider.local,
-                    is_active=True,
-                )
-                session.add(user)
-                print(f"  - Created {user_data['username']} ({user_data['email']}) with role {user_data['role'].value}")
+            rows = [
+                {
+                    "username": user_data["username"],
+                    "email": user_data["email"],
+                    "password_hash": get_password_hash(user_data["password"]),
+                    "role": user_data["role"],
+                    "auth_provider": AuthProvider.local,
+                    "is_active": True,
+                }
+                for user_data in test_users
+            ]
+            # One multi-row INSERT ... RETURNING instead of one INSERT per user
+            result = await session.execute(insert(User).returning(User.id, sort_by_parameter_order=True), rows)
+            for user_data, user_id in zip(test_users, result.scalars().all()):
+                print(f"  - Created {user_data['username']} ({user_data['email']}) with role {user_data['role'].value} (ID: {user_id})")
             
+            # Single commit so the whole reset is applied (or rolled back) atomically
             await session.commit()
             print("\nSuccessfully reset users!")
             print("\nTest users created:")
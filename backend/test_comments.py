@@ -5,11 +5,45 @@ Tests that comments are properly associated with logged-in users.
 
 import asyncio
 import httpx
-import json
+import logging
+import logging.handlers
+import os
+import queue
+
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api/v1"
 
+# Set COMMENTS_TEST_IN_PROCESS=1 to call the FastAPI app directly through
+# httpx.ASGITransport instead of a running server on localhost:8000
+IN_PROCESS = os.getenv("COMMENTS_TEST_IN_PROCESS") == "1"
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Connection pool shared by every request in the test run
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+# Progress output goes through a QueueHandler so formatting and the stdout
+# write happen on the listener thread instead of between awaits
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Route this module's log records through a queue drained by a background thread."""
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
+
 # Test user credentials
 TEST_USERS = {
     "admin": {"username": "test_admin", "password": "password123"},
@@ -18,215 +52,215 @@ TEST_USERS = {
 }
 
 
-async def login(username: str, password: str) -> str:
-    """Login and get access token."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{API_BASE}/auth/login",
-            json={"username": username, "password": password}
+def make_client() -> httpx.AsyncClient:
+    """Create the client used for the whole run, in-process or over TCP."""
+    if IN_PROCESS:
+        from app.main import app
+
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test/api/v1",
+            timeout=30.0,
         )
-        if response.status_code != 200:
-            raise Exception(f"Login failed: {response.status_code} - {response.text}")
-        data = response.json()
-        return data["access_token"]
+    return httpx.AsyncClient(base_url=API_BASE, timeout=30.0, limits=CLIENT_LIMITS)
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> str:
+    """Login and get access token."""
+    response = await client.post(
+        "/auth/login",
+        headers=JSON_HEADERS,
+        content=orjson.dumps({"username": username, "password": password})
+    )
+    if response.status_code != 200:
+        raise Exception(f"Login failed: {response.status_code} - {response.text}")
+    data = orjson.loads(response.content)
+    return data["access_token"]
 
 
-async def get_trackers(token: str) -> list:
+async def get_trackers(client: httpx.AsyncClient, token: str) -> list:
     """Get list of trackers."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{API_BASE}/reporting-effort-tracker/",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            raise Exception(f"Failed to get trackers: {response.status_code} - {response.text}")
-        return response.json()
+    response = await client.get(
+        "/reporting-effort-tracker/",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        raise Exception(f"Failed to get trackers: {response.status_code} - {response.text}")
+    return orjson.loads(response.content)
 
 
-async def create_comment(token: str, tracker_id: int, comment_text: str, comment_type: str = "programming") -> dict:
+async def create_comment(client: httpx.AsyncClient, token: str, tracker_id: int, comment_text: str, comment_type: str = "programming") -> dict:
     """Create a comment."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{API_BASE}/tracker-comments/",
-            headers={"Authorization": f"Bearer {token}"},
-            json={
-                "tracker_id": tracker_id,
-                "comment_text": comment_text,
-                "comment_type": comment_type
-            }
-        )
-        if response.status_code != 201:
-            raise Exception(f"Failed to create comment: {response.status_code} - {response.text}")
-        return response.json()
+    response = await client.post(
+        "/tracker-comments/",
+        headers={**JSON_HEADERS, "Authorization": f"Bearer {token}"},
+        content=orjson.dumps({
+            "tracker_id": tracker_id,
+            "comment_text": comment_text,
+            "comment_type": comment_type
+        })
+    )
+    if response.status_code != 201:
+        raise Exception(f"Failed to create comment: {response.status_code} - {response.text}")
+    return orjson.loads(response.content)
+
+async def create_comments_bulk(client: httpx.AsyncClient, tracker_id: int, token_text_type_triples: list) -> list:
+    """Create several comments concurrently from (token, comment_text, comment_type) triples.
+
+    Returns the created comments in the same order as the triples.
+    """
+    return await asyncio.gather(*(
+        create_comment(client, token, tracker_id, comment_text, comment_type)
+        for token, comment_text, comment_type in token_text_type_triples
+    ))
 
 
-async def get_comments(token: str, tracker_id: int) -> list:
+async def get_comments(client: httpx.AsyncClient, token: str, tracker_id: int) -> list:
     """Get comments for a tracker."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{API_BASE}/tracker-comments/tracker/{tracker_id}",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            raise Exception(f"Failed to get comments: {response.status_code} - {response.text}")
-        return response.json()
+    response = await client.get(
+        f"/tracker-comments/tracker/{tracker_id}",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        raise Exception(f"Failed to get comments: {response.status_code} - {response.text}")
+    return orjson.loads(response.content)
 
 
-async def get_current_user(token: str) -> dict:
+async def get_current_user(client: httpx.AsyncClient, token: str) -> dict:
     """Get current user info."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{API_BASE}/auth/me",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            raise Exception(f"Failed to get user: {response.status_code} - {response.text}")
-        return response.json()
+    response = await client.get(
+        "/auth/me",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        raise Exception(f"Failed to get user: {response.status_code} - {response.text}")
+    return orjson.loads(response.content)
+
+
+async def bootstrap(client: httpx.AsyncClient, credentials: dict) -> tuple:
+    """Login a test user and fetch their profile. Returns (token, user)."""
+    token = await login(client, credentials["username"], credentials["password"])
+    user = await get_current_user(client, token)
+    return token, user
+
+
+async def verify_comments_visible(client: httpx.AsyncClient, token: str, tracker_id: int, expected_usernames: tuple) -> list:
+    """Get comments for a tracker and assert every expected author has a comment."""
+    comments = await get_comments(client, token, tracker_id)
+    comment_usernames = {c['username'] for c in comments}
+    missing = [username for username in expected_usernames if username not in comment_usernames]
+    assert not missing, f"Comments not found for: {', '.join(missing)}"
+    return comments
 
 
 async def test_comment_feature():
     """Test comment feature with different users."""
-    print("=" * 80)
-    print("Testing Comment Feature with Authentication")
-    print("=" * 80)
+    logger.info("=" * 80)
+    logger.info("Testing Comment Feature with Authentication")
+    logger.info("=" * 80)
     
     try:
-        # Test 1: Login as admin
-        print("\n1. Logging in as test_admin...")
-        admin_token = await login(TEST_USERS["admin"]["username"], TEST_USERS["admin"]["password"])
-        admin_user = await get_current_user(admin_token)
-        print(f"   [OK] Logged in as: {admin_user['username']} (ID: {admin_user['id']}, Role: {admin_user['role']})")
-        
-        # Test 2: Get a tracker
-        print("\n2. Getting trackers...")
-        trackers = await get_trackers(admin_token)
-        if not trackers:
-            print("   [WARNING] No trackers found. Please create a tracker first.")
-            return
+        # One client for the whole run so requests share pooled keep-alive connections
+        async with make_client() as client:
+            # Test 1: Login all test users concurrently (the logins are independent)
+            logger.info("\n1. Logging in as test_admin, test_editor and test_viewer...")
+            (admin_token, admin_user), (editor_token, editor_user), (viewer_token, viewer_user) = (
+                await asyncio.gather(*(bootstrap(client, creds) for creds in TEST_USERS.values()))
+            )
+            for user in (admin_user, editor_user, viewer_user):
+                logger.info(f"   [OK] Logged in as: {user['username']} (ID: {user['id']}, Role: {user['role']})")
         
-        tracker = trackers[0]
-        tracker_id = tracker["id"]
-        print(f"   [OK] Using tracker ID: {tracker_id}")
+            # Test 2: Get a tracker
+            logger.info("\n2. Getting trackers...")
+            trackers = await get_trackers(client, admin_token)
+            if not trackers:
+                logger.info("   [WARNING] No trackers found. Please create a tracker first.")
+                return
         
-        # Test 3: Create comment as admin
-        print(f"\n3. Creating comment as {admin_user['username']}...")
-        admin_comment = await create_comment(
-            admin_token,
-            tracker_id,
-            f"This is a test comment from {admin_user['username']}",
-            "programming"
-        )
-        print(f"   [OK] Comment created!")
-        print(f"     Comment ID: {admin_comment['id']}")
-        print(f"     User ID: {admin_comment['user_id']}")
-        print(f"     Username: {admin_comment['username']}")
-        print(f"     Text: {admin_comment['comment_text'][:50]}...")
+            tracker = trackers[0]
+            tracker_id = tracker["id"]
+            logger.info(f"   [OK] Using tracker ID: {tracker_id}")
         
-        # Verify comment is associated with admin
-        assert admin_comment['user_id'] == admin_user['id'], \
-            f"Comment user_id ({admin_comment['user_id']}) doesn't match logged-in user ({admin_user['id']})"
-        assert admin_comment['username'] == admin_user['username'], \
-            f"Comment username ({admin_comment['username']}) doesn't match logged-in user ({admin_user['username']})"
-        print(f"   [OK] Comment correctly associated with {admin_user['username']}")
+            # Test 3: Create one comment per user; the POSTs are independent so
+            # they are sent together instead of one round-trip after another
+            logger.info("\n3. Creating comments as test_admin, test_editor and test_viewer...")
+            users = (admin_user, editor_user, viewer_user)
+            created_comments = await create_comments_bulk(client, tracker_id, [
+                (admin_token, f"This is a test comment from {admin_user['username']}", "programming"),
+                (editor_token, f"This is a test comment from {editor_user['username']}", "biostat"),
+                (viewer_token, f"This is a test comment from {viewer_user['username']}", "programming"),
+            ])
+            for user, comment in zip(users, created_comments):
+                logger.info(f"   [OK] Comment created by {user['username']}!")
+                logger.info(f"     Comment ID: {comment['id']}")
+                logger.info(f"     User ID: {comment['user_id']}")
+                logger.info(f"     Username: {comment['username']}")
+                logger.info(f"     Text: {comment['comment_text'][:50]}...")
         
-        # Test 4: Login as editor
-        print("\n4. Logging in as test_editor...")
-        editor_token = await login(TEST_USERS["editor"]["username"], TEST_USERS["editor"]["password"])
-        editor_user = await get_current_user(editor_token)
-        print(f"   [OK] Logged in as: {editor_user['username']} (ID: {editor_user['id']}, Role: {editor_user['role']})")
+                # Verify comment is associated with the user who created it
+                assert comment['user_id'] == user['id'], \
+                    f"Comment user_id ({comment['user_id']}) doesn't match logged-in user ({user['id']})"
+                assert comment['username'] == user['username'], \
+                    f"Comment username ({comment['username']}) doesn't match logged-in user ({user['username']})"
+                logger.info(f"   [OK] Comment correctly associated with {user['username']}")
         
-        # Test 5: Create comment as editor
-        print(f"\n5. Creating comment as {editor_user['username']}...")
-        editor_comment = await create_comment(
-            editor_token,
-            tracker_id,
-            f"This is a test comment from {editor_user['username']}",
-            "biostat"
-        )
-        print(f"   [OK] Comment created!")
-        print(f"     Comment ID: {editor_comment['id']}")
-        print(f"     User ID: {editor_comment['user_id']}")
-        print(f"     Username: {editor_comment['username']}")
-        print(f"     Text: {editor_comment['comment_text'][:50]}...")
+            # Test 4: Editor and viewer read the comments concurrently; if either
+            # check fails the TaskGroup cancels the other one immediately
+            logger.info("\n4. Retrieving all comments for tracker as test_editor and test_viewer...")
+            expected_usernames = tuple(user['username'] for user in users)
+            async with asyncio.TaskGroup() as tg:
+                editor_read = tg.create_task(
+                    verify_comments_visible(client, editor_token, tracker_id, expected_usernames)
+                )
+                viewer_read = tg.create_task(
+                    verify_comments_visible(client, viewer_token, tracker_id, expected_usernames)
+                )
+            all_comments = editor_read.result()
+            logger.info(f"   [OK] Found {len(all_comments)} comment(s)")
         
-        # Verify comment is associated with editor
-        assert editor_comment['user_id'] == editor_user['id'], \
-            f"Comment user_id ({editor_comment['user_id']}) doesn't match logged-in user ({editor_user['id']})"
-        assert editor_comment['username'] == editor_user['username'], \
-            f"Comment username ({editor_comment['username']}) doesn't match logged-in user ({editor_user['username']})"
-        print(f"   [OK] Comment correctly associated with {editor_user['username']}")
+            for comment in all_comments:
+                logger.info(f"     - Comment {comment['id']}: by {comment['username']} (ID: {comment['user_id']})")
+                logger.info(f"       Text: {comment['comment_text'][:50]}...")
         
-        # Test 6: Get all comments and verify
-        print("\n6. Retrieving all comments for tracker...")
-        all_comments = await get_comments(editor_token, tracker_id)
-        print(f"   [OK] Found {len(all_comments)} comment(s)")
+            logger.info(f"   [OK] All comments found with correct usernames")
+            logger.info(f"   [OK] Viewer can see {len(viewer_read.result())} comment(s)")
         
-        for comment in all_comments:
-            print(f"     - Comment {comment['id']}: by {comment['username']} (ID: {comment['user_id']})")
-            print(f"       Text: {comment['comment_text'][:50]}...")
+            # Final verification
+            logger.info("\n5. Final verification - All comments...")
+            final_comments = await get_comments(client, admin_token, tracker_id)
+            logger.info(f"   [OK] Total comments: {len(final_comments)}")
         
-        # Verify we have both comments
-        comment_usernames = [c['username'] for c in all_comments]
-        assert TEST_USERS["admin"]["username"] in comment_usernames, "Admin comment not found"
-        assert TEST_USERS["editor"]["username"] in comment_usernames, "Editor comment not found"
-        print(f"   [OK] Both comments found with correct usernames")
+            # Build the listing up front and emit it as a single record
+            lines = [
+                f"     - Comment {c['id']}: '{c['comment_text'][:40]}...'\n"
+                f"       Created by: {c['username']} (User ID: {c['user_id']})\n"
+                f"       Type: {c['comment_type']}, Resolved: {c['is_resolved']}"
+                for c in final_comments
+            ]
+            if lines:
+                logger.info("\n".join(lines))
         
-        # Test 7: Login as viewer and verify they can see comments
-        print("\n7. Logging in as test_viewer...")
-        viewer_token = await login(TEST_USERS["viewer"]["username"], TEST_USERS["viewer"]["password"])
-        viewer_user = await get_current_user(viewer_token)
-        print(f"   [OK] Logged in as: {viewer_user['username']} (ID: {viewer_user['id']}, Role: {viewer_user['role']})")
-        
-        viewer_comments = await get_comments(viewer_token, tracker_id)
-        print(f"   [OK] Viewer can see {len(viewer_comments)} comment(s)")
-        
-        # Test 8: Create comment as viewer
-        print(f"\n8. Creating comment as {viewer_user['username']}...")
-        viewer_comment = await create_comment(
-            viewer_token,
-            tracker_id,
-            f"This is a test comment from {viewer_user['username']}",
-            "programming"
-        )
-        print(f"   [OK] Comment created!")
-        print(f"     Comment ID: {viewer_comment['id']}")
-        print(f"     User ID: {viewer_comment['user_id']}")
-        print(f"     Username: {viewer_comment['username']}")
-        print(f"     Text: {viewer_comment['comment_text'][:50]}...")
-        
-        # Verify comment is associated with viewer
-        assert viewer_comment['user_id'] == viewer_user['id'], \
-            f"Comment user_id ({viewer_comment['user_id']}) doesn't match logged-in user ({viewer_user['id']})"
-        assert viewer_comment['username'] == viewer_user['username'], \
-            f"Comment username ({viewer_comment['username']}) doesn't match logged-in user ({viewer_user['username']})"
-        print(f"   [OK] Comment correctly associated with {viewer_user['username']}")
-        
-        # Final verification
-        print("\n9. Final verification - All comments...")
-        final_comments = await get_comments(admin_token, tracker_id)
-        print(f"   [OK] Total comments: {len(final_comments)}")
-        
-        for comment in final_comments:
-            print(f"     - Comment {comment['id']}: '{comment['comment_text'][:40]}...'")
-            print(f"       Created by: {comment['username']} (User ID: {comment['user_id']})")
-            print(f"       Type: {comment['comment_type']}, Resolved: {comment['is_resolved']}")
-        
-        print("\n" + "=" * 80)
-        print("[SUCCESS] All tests passed! Comment feature is working correctly.")
-        print("=" * 80)
-        print("\nSummary:")
-        print(f"  - Created {len(final_comments)} comment(s)")
-        print(f"  - Comments correctly associated with logged-in users")
-        print(f"  - Usernames displayed correctly")
-        print(f"  - All users can create and view comments")
+            logger.info("\n" + "=" * 80)
+            logger.info("[SUCCESS] All tests passed! Comment feature is working correctly.")
+            logger.info("=" * 80)
+            logger.info("\nSummary:")
+            logger.info(f"  - Created {len(final_comments)} comment(s)")
+            logger.info(f"  - Comments correctly associated with logged-in users")
+            logger.info(f"  - Usernames displayed correctly")
+            logger.info(f"  - All users can create and view comments")
         
     except Exception as e:
-        print(f"\n[ERROR] Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"\n[ERROR] Test failed: {e}")
         raise
 
 
 if __name__ == "__main__":
-    asyncio.run(test_comment_feature())
+    listener = start_log_listener()
+    try:
+        if uvloop is not None:
+            uvloop.run(test_comment_feature())
+        else:
+            asyncio.run(test_comment_feature())
+    finally:
+        listener.stop()
 
@@ -1,68 +1,89 @@
 #!/usr/bin/env python3
 """
 Test WebSocket broadcasting by making CRUD operations via HTTP API
+
+Usage:
+    python tests/integration/test_websocket_broadcast.py --demo   # one slow cycle to watch in the frontend
+    python tests/integration/test_websocket_broadcast.py -n 20    # 20 concurrent create/update/delete cycles
 """
 
+import argparse
 import asyncio
-import json
-import requests
 import time
 
+import httpx
+
 BASE_URL = "http://localhost:8000/api/v1"
 
-def create_study(label):
+# Pause between steps in --demo mode so the frontend has time to render each event
+DEMO_DELAY = 2
+
+async def create_study(client, label):
     """Create a study via HTTP API"""
-    response = requests.post(f"{BASE_URL}/studies/", 
-                           json={"study_label": label})
+    response = await client.post("/studies/", json={"study_label": label})
     print(f"Create study '{label}': {response.status_code}")
     if response.status_code == 201:
         return response.json()
     return None
 
-def update_study(study_id, label):
+async def update_study(client, study_id, label):
     """Update a study via HTTP API"""
-    response = requests.put(f"{BASE_URL}/studies/{study_id}", 
-                          json={"study_label": label})
+    response = await client.put(f"/studies/{study_id}", json={"study_label": label})
     print(f"Update study {study_id} to '{label}': {response.status_code}")
     return response.status_code == 200
 
-def delete_study(study_id):
+async def delete_study(client, study_id):
     """Delete a study via HTTP API"""
-    response = requests.delete(f"{BASE_URL}/studies/{study_id}")
+    response = await client.delete(f"/studies/{study_id}")
     print(f"Delete study {study_id}: {response.status_code}")
     return response.status_code == 200
 
-def main():
-    print("🧪 Testing WebSocket broadcasting with CRUD operations...")
-    print("👀 Watch your frontend for real-time updates!")
-    
-    # Test 1: Create a study
-    print("\n1️⃣ Creating a test study...")
-    study = create_study("WebSocket Test Study")
+async def cycle(client, label, delay=0):
+    """Create, update and delete one study. Returns True if every step succeeded."""
+    study = await create_study(client, label)
     if not study:
-        print("❌ Failed to create study")
-        return
-    
+        print(f"❌ Failed to create study '{label}'")
+        return False
+
     study_id = study["id"]
     print(f"✅ Created study with ID: {study_id}")
-    time.sleep(2)
-    
-    # Test 2: Update the study
-    print("\n2️⃣ Updating the study...")
-    if update_study(study_id, "Updated WebSocket Test"):
-        print("✅ Study updated")
-    else:
-        print("❌ Failed to update study")
-    time.sleep(2)
-    
-    # Test 3: Delete the study
-    print("\n3️⃣ Deleting the study...")
-    if delete_study(study_id):
-        print("✅ Study deleted")
-    else:
-        print("❌ Failed to delete study")
-    
-    print("\n🎉 Test completed! Check your frontend for real-time updates.")
+    await asyncio.sleep(delay)
+
+    updated = await update_study(client, study_id, f"Updated {label}")
+    print("✅ Study updated" if updated else "❌ Failed to update study")
+    await asyncio.sleep(delay)
+
+    deleted = await delete_study(client, study_id)
+    print("✅ Study deleted" if deleted else "❌ Failed to delete study")
+    return updated and deleted
+
+async def main(cycles=1, demo=False):
+    print("🧪 Testing WebSocket broadcasting with CRUD operations...")
+    print("👀 Watch your frontend for real-time updates!")
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as client:
+        if demo:
+            ok = await cycle(client, "WebSocket Test Study", delay=DEMO_DELAY)
+            results = [ok]
+        else:
+            # Study labels are unique, so every concurrent cycle gets its own
+            run_id = int(time.time())
+            started = time.perf_counter()
+            results = await asyncio.gather(*(
+                cycle(client, f"WebSocket Test Study {run_id}-{i}") for i in range(cycles)
+            ))
+            elapsed = time.perf_counter() - started
+            print(f"\n⏱️ {cycles} cycle(s) ({cycles * 3} broadcasts) in {elapsed:.2f}s")
+
+    print(f"\n🎉 Test completed! {sum(results)}/{len(results)} cycle(s) succeeded. "
+          "Check your frontend for real-time updates.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--cycles", type=int, default=1, help="number of concurrent create/update/delete cycles")
+    parser.add_argument("--demo", action="store_true", help="run a single cycle with pauses for visual inspection")
+    args = parser.parse_args()
+    asyncio.run(main(cycles=args.cycles, demo=args.demo))
@@ -5,20 +5,46 @@ Run this to verify auth system is working correctly.
 
 import asyncio
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add backend to path
 backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path))
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password, create_access_token, decode_token
 from app.models.user import User, UserRole, AuthProvider
 from sqlalchemy import select
 
 
+# Test-only shortcut: bcrypt salts every hash, so caching by plaintext is
+# never safe for real authentication, but it lets repeated runs in one
+# process skip re-hashing the same fixed test passwords
+@lru_cache(maxsize=32)
+def _cached_hash(password: str) -> str:
+    return get_password_hash(password)
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> AsyncEngine:
+    """Engine shared by every test run in this process, so the pool stays warm."""
+    return create_async_engine(
+        settings.database_url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_session_factory() -> async_sessionmaker:
+    """Session factory bound to the shared engine."""
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
+
+
 async def test_auth_system():
     """Test the authentication system"""
     
@@ -26,14 +52,10 @@ async def test_auth_system():
     print("PEARL AUTHENTICATION SYSTEM TEST")
     print("="*80)
     
-    # Create async engine
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    
-    async with async_session() as db:
+    async with get_session_factory()() as db:
         print("\n1. Testing password hashing...")
         password = "testpassword123"
-        hashed = get_password_hash(password)
+        hashed = _cached_hash(password)
         print(f"   [OK] Password hashed successfully")
         print(f"   [OK] Verification: {verify_password(password, hashed)}")
         
@@ -49,7 +71,7 @@ async def test_auth_system():
             test_user = User(
                 username="test_admin",
                 email="test@pearl.local",
-                password_hash=get_password_hash("admin123"),
+                password_hash=_cached_hash("admin123"),
                 role=UserRole.ADMIN,
                 auth_provider=AuthProvider.local,
                 is_active=True,
@@ -99,10 +121,16 @@ async def test_auth_system():
         print("\nAll tests passed! [SUCCESS]")
         print("You can now use these credentials to login through the React frontend.")
         print("="*80)
-    
-    await engine.dispose()
+
+
+async def main():
+    """Run the test once, then release the pooled connections."""
+    try:
+        await test_auth_system()
+    finally:
+        await get_engine().dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_auth_system())
+    asyncio.run(main())
 
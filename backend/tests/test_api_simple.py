@@ -1,49 +1,102 @@
 #!/usr/bin/env python3
-"""Test the API endpoint directly with Python requests."""
+"""Test the API endpoint directly, optionally as a concurrent stress loop.
 
-import requests
+Usage: python tests/test_api_simple.py [request_count]
+"""
+
+import asyncio
+import statistics
+import sys
 import time
+from collections import defaultdict
+
+import httpx
+import orjson
 
 BASE_URL = "http://localhost:8000/api/v1"
 
-def test_item_creation():
-    """Test item creation via API."""
-    
-    # Create unique item code
-    unique_code = f"T_API_TEST_{int(time.time())}"
-    
-    payload = {
-        "reporting_effort_id": 13,
-        "item_type": "TLF",
-        "item_subtype": "Table", 
-        "item_code": unique_code,
-        "source_type": "custom"
-    }
-    
-    print(f"Sending request with payload: {payload}")
-    
-    try:
-        response = requests.post(
-            f"{BASE_URL}/reporting-effort-items/",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        print(f"Response status: {response.status_code}")
-        print(f"Response headers: {dict(response.headers)}")
-        print(f"Response content: {response.text}")
-        
-        if response.status_code == 201:
-            data = response.json()
-            print(f"SUCCESS: Created item with ID: {data.get('id', 'NOT_FOUND')}")
-            return True
+# Default number of concurrent creations when run as a script
+REQUEST_COUNT = 50
+MAX_CONNECTIONS = 64
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+ITEM_CODE_PLACEHOLDER = b"__ITEM_CODE__"
+
+# Fixed-shape payload serialized once; only the item code differs per request
+PAYLOAD_TEMPLATE = orjson.dumps({
+    "reporting_effort_id": 13,
+    "item_type": "TLF",
+    "item_subtype": "Table",
+    "item_code": ITEM_CODE_PLACEHOLDER.decode(),
+    "source_type": "custom"
+})
+
+
+async def create_item(client: httpx.AsyncClient, item_code: str):
+    """Create a single item. Returns (status_code, latency_seconds, response)."""
+    body = PAYLOAD_TEMPLATE.replace(ITEM_CODE_PLACEHOLDER, item_code.encode())
+    start = time.perf_counter()
+    response = await client.post("/reporting-effort-items/", content=body, headers=JSON_HEADERS)
+    return response.status_code, time.perf_counter() - start, response
+
+
+def print_latency_summary(latencies_by_status, elapsed: float, total: int) -> None:
+    """Print request counts and latency percentiles grouped by status code."""
+    print(f"Completed {total} requests in {elapsed:.3f}s ({total / elapsed:.1f} req/s)")
+    for status_code, latencies in sorted(latencies_by_status.items()):
+        latencies_ms = sorted(latency * 1000 for latency in latencies)
+        if len(latencies_ms) > 1:
+            percentiles = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+            p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
         else:
-            print(f"FAILED: {response.status_code} - {response.text}")
-            return False
-            
-    except Exception as e:
+            p50 = p95 = p99 = latencies_ms[0]
+        print(
+            f"  {status_code}: {len(latencies_ms)} requests - "
+            f"p50 {p50:.1f}ms, p95 {p95:.1f}ms, p99 {p99:.1f}ms"
+        )
+
+
+async def run(n: int) -> bool:
+    """Create n items concurrently and report latencies. Returns True if all succeeded."""
+
+    # Microsecond run id plus the request index keeps item codes unique
+    run_id = int(time.time() * 1e6)
+    print(f"Sending {n} concurrent create requests to {BASE_URL}/reporting-effort-items/")
+
+    try:
+        async with httpx.AsyncClient(
+            base_url=BASE_URL,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+        ) as client:
+            started = time.perf_counter()
+            results = await asyncio.gather(*(
+                create_item(client, f"T_API_TEST_{run_id}_{i}") for i in range(n)
+            ))
+            elapsed = time.perf_counter() - started
+    except httpx.HTTPError as e:
         print(f"ERROR: {e}")
         return False
 
+    latencies_by_status = defaultdict(list)
+    for status_code, latency, _ in results:
+        latencies_by_status[status_code].append(latency)
+    print_latency_summary(latencies_by_status, elapsed, n)
+
+    failures = [response for status_code, _, response in results if status_code != 201]
+    if failures:
+        print(f"FAILED: {len(failures)} of {n} requests, first error: "
+              f"{failures[0].status_code} - {failures[0].text}")
+        return False
+
+    print(f"SUCCESS: Created {n} items")
+    return True
+
+
+async def test_item_creation():
+    """Test item creation via API."""
+    return await run(1)
+
+
 if __name__ == "__main__":
-    test_item_creation()
\ No newline at end of file
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else REQUEST_COUNT
+    asyncio.run(run(count))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Direct test of creating related rows in one transaction via create(commit=False)."""
+
+import asyncio
+import os
+import sys
+import time
+import traceback
+from app.db.session import AsyncSessionLocal
+from app.schemas.study import StudyCreate
+from app.schemas.database_release import DatabaseReleaseCreate
+from app.crud.study import study
+from app.crud.database_release import database_release
+from app.models.study import Study
+from app.models.database_release import DatabaseRelease
+
+async def test_study_and_release_single_commit():
+    """Create a study and its first database release, committing once."""
+
+    label = f"Single Commit Study {time.time_ns()}"
+
+    async with AsyncSessionLocal() as db:
+        try:
+            # Flushed only: the study gets its id but nothing is committed yet
+            created_study = await study.create(db, obj_in=StudyCreate(study_label=label), commit=False)
+            print(f"Flushed study with ID: {created_study.id}")
+
+            created_release = await database_release.create(
+                db,
+                obj_in=DatabaseReleaseCreate(study_id=created_study.id, database_release_label="DBR 1"),
+                commit=False
+            )
+            print(f"Flushed database release with ID: {created_release.id}")
+
+            await db.commit()
+            study_id, release_id = created_study.id, created_release.id
+        except Exception as e:
+            await db.rollback()
+            print(f"ERROR during creation: {type(e).__name__}: {e}")
+            # Full stack traces only on request (PEARL_TEST_VERBOSE=1)
+            if os.getenv("PEARL_TEST_VERBOSE"):
+                traceback.print_exc()
+            return False
+
+    # Verify from a fresh session that both rows were committed
+    async with AsyncSessionLocal() as db:
+        persisted_study = await db.get(Study, study_id)
+        persisted_release = await db.get(DatabaseRelease, release_id)
+        ok = persisted_study is not None and persisted_release is not None
+        print(f"{'SUCCESS' if ok else 'ERROR'}: study {study_id} and release {release_id} "
+              f"{'both' if ok else 'not both'} persisted by a single commit")
+
+        # Clean up
+        if persisted_release is not None:
+            await db.delete(persisted_release)
+        if persisted_study is not None:
+            await db.delete(persisted_study)
+        await db.commit()
+        return ok
+
+if __name__ == "__main__":
+    result = asyncio.run(test_study_and_release_single_commit())
+    sys.exit(0 if result else 1)
@@ -13,55 +13,51 @@ from pydantic import ValidationError
 from app.schemas.database_release import DatabaseReleaseCreate, DatabaseReleaseUpdate, DatabaseRelease
 
 
+VALID_CREATE_PAYLOAD = {
+    "study_id": 1,
+    "database_release_label": "Release v1.0"
+}
+
+INVALID_CREATE_CASES = [
+    pytest.param({"study_id": 0, "database_release_label": "Release v1.0"}, "greater than 0", id="zero-study-id"),
+    pytest.param({"study_id": -1, "database_release_label": "Release v1.0"}, "greater than 0", id="negative-study-id"),
+    pytest.param({"study_id": 1, "database_release_label": ""}, "at least 1 character", id="empty-label"),
+    # Exceeds 255 character limit
+    pytest.param({"study_id": 1, "database_release_label": "x" * 256}, "at most 255 characters", id="long-label"),
+]
+
+INVALID_UPDATE_CASES = [
+    pytest.param({"database_release_label": ""}, "at least 1 character", id="empty-label"),
+]
+
+
 class TestDatabaseReleaseValidation:
     """Test database release schema validation."""
     
     def test_database_release_create_valid(self):
         """Test valid database release creation data."""
-        valid_data = {
-            "study_id": 1,
-            "database_release_label": "Release v1.0"
-        }
-        schema = DatabaseReleaseCreate(**valid_data)
+        schema = DatabaseReleaseCreate.model_validate(VALID_CREATE_PAYLOAD)
         assert schema.study_id == 1
         assert schema.database_release_label == "Release v1.0"
     
-    def test_database_release_create_invalid_study_id(self):
-        """Test invalid study_id validation."""
+    @pytest.mark.parametrize("payload,error", INVALID_CREATE_CASES)
+    def test_database_release_create_invalid(self, payload, error):
+        """Test study_id and label validation on create."""
         with pytest.raises(ValidationError) as exc_info:
-            DatabaseReleaseCreate(study_id=0, database_release_label="Release v1.0")
-        assert "greater than 0" in str(exc_info.value)
-        
-        with pytest.raises(ValidationError) as exc_info:
-            DatabaseReleaseCreate(study_id=-1, database_release_label="Release v1.0")
-        assert "greater than 0" in str(exc_info.value)
-    
-    def test_database_release_create_empty_label(self):
-        """Test empty label validation."""
-        with pytest.raises(ValidationError) as exc_info:
-            DatabaseReleaseCreate(study_id=1, database_release_label="")
-        assert "at least 1 character" in str(exc_info.value)
-    
-    def test_database_release_create_long_label(self):
-        """Test label length validation."""
-        long_label = "x" * 256  # Exceeds 255 character limit
-        with pytest.raises(ValidationError) as exc_info:
-            DatabaseReleaseCreate(study_id=1, database_release_label=long_label)
-        assert "at most 255 characters" in str(exc_info.value)
+            DatabaseReleaseCreate.model_validate(payload)
+        assert error in str(exc_info.value)
     
     def test_database_release_update_valid(self):
         """Test valid database release update data."""
-        valid_data = {
-            "database_release_label": "Updated Release v1.1"
-        }
-        schema = DatabaseReleaseUpdate(**valid_data)
+        schema = DatabaseReleaseUpdate.model_validate({"database_release_label": "Updated Release v1.1"})
         assert schema.database_release_label == "Updated Release v1.1"
     
-    def test_database_release_update_empty_label(self):
-        """Test empty label validation in update."""
+    @pytest.mark.parametrize("payload,error", INVALID_UPDATE_CASES)
+    def test_database_release_update_invalid(self, payload, error):
+        """Test label validation on update."""
         with pytest.raises(ValidationError) as exc_info:
-            DatabaseReleaseUpdate(database_release_label="")
-        assert "at least 1 character" in str(exc_info.value)
+            DatabaseReleaseUpdate.model_validate(payload)
+        assert error in str(exc_info.value)
     
     def test_database_release_response_schema(self):
         """Test database release response schema."""
@@ -2,25 +2,30 @@
 """Direct test of reporting effort item creation without API layer."""
 
 import asyncio
+import os
 import sys
+import time
+import traceback
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import AsyncSessionLocal
 from app.schemas.reporting_effort_item import ReportingEffortItemCreate
 from app.crud.reporting_effort_item import reporting_effort_item
-from app.crud.reporting_effort import reporting_effort
+from app.models.reporting_effort import ReportingEffort
 
 async def test_item_creation():
     """Test item creation directly via CRUD layer."""
     
     async with AsyncSessionLocal() as db:
         try:
-            # First, get an existing reporting effort
-            efforts = await reporting_effort.get_multi(db, skip=0, limit=1)
-            if not efforts:
+            # First, get an existing reporting effort; only its ID is needed,
+            # so skip get_multi's joined study/database release loading
+            result = await db.execute(select(ReportingEffort.id).limit(1))
+            effort_id = result.scalar_one_or_none()
+            if effort_id is None:
                 print("ERROR: No reporting efforts found. Create one first.")
                 return False
                 
-            effort_id = efforts[0].id
             print(f"Using reporting effort ID: {effort_id}")
             
             # Create item data
@@ -28,7 +33,7 @@ async def test_item_creation():
                 reporting_effort_id=effort_id,
                 item_type="TLF",
                 item_subtype="Table", 
-                item_code=f"T_DIRECT_TEST_{asyncio.get_event_loop().time()}",
+                item_code=f"T_DIRECT_TEST_{time.time_ns()}",
                 source_type="custom"
             )
             
@@ -46,9 +51,10 @@ async def test_item_creation():
             return True
             
         except Exception as e:
-            print(f"ERROR during item creation: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"ERROR during item creation: {type(e).__name__}: {e}")
+            # Full stack traces only on request (PEARL_TEST_VERBOSE=1)
+            if os.getenv("PEARL_TEST_VERBOSE"):
+                traceback.print_exc()
             return False
 
 if __name__ == "__main__":
@@ -2,7 +2,10 @@
 """Test minimal API endpoint functionality."""
 
 import asyncio
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
 from app.schemas.reporting_effort_item import ReportingEffortItemCreate, ReportingEffortItem
@@ -10,7 +13,17 @@ from app.crud.reporting_effort_item import reporting_effort_item
 
 app = FastAPI()
 
-@app.post("/test-item", response_model=dict)
+
+class MinimalItemResponse(BaseModel):
+    """Minimal item creation response."""
+
+    success: bool
+    id: int
+    item_code: str
+    item_type: str
+
+
+@app.post("/test-item", response_model=MinimalItemResponse, response_class=ORJSONResponse)
 async def test_create_item(
     item_in: ReportingEffortItemCreate,
     db: AsyncSession = Depends(get_db)
@@ -23,20 +36,19 @@ async def test_create_item(
             obj_in=item_in,
             auto_create_tracker=True
         )
-        
-        # Return simple dict response
-        return {
-            "success": True,
-            "id": created_item.id,
-            "item_code": created_item.item_code,
-            "item_type": created_item.item_type.value if hasattr(created_item.item_type, 'value') else str(created_item.item_type)
-        }
-        
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    except (IntegrityError, ValueError) as e:
+        # Duplicates and invalid data (pydantic's ValidationError is a
+        # ValueError) are client errors; anything else goes to FastAPI's
+        # default 500 handler
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    # Return simple response
+    return MinimalItemResponse(
+        success=True,
+        id=created_item.id,
+        item_code=created_item.item_code,
+        item_type=str(getattr(created_item.item_type, 'value', created_item.item_type))
+    )
 
 if __name__ == "__main__":
     import uvicorn
@@ -7,6 +7,8 @@ common issues it can detect.
 """
 
 import sys
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
 
 # Add current directory to path for imports
@@ -14,6 +16,29 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from fastapi_model_validator import FastAPIModelValidator, Severity
 
+# backend/ (this file lives in backend/tests/validator)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Severity members in declaration order (most to least severe)
+SEVERITY_ORDER = tuple(Severity)
+
+SEVERITY_ICON = {
+    "CRITICAL": "🔴",
+    "HIGH": "🟠",
+    "MEDIUM": "🟡",
+    "LOW": "🔵",
+    "INFO": "ℹ️"
+}
+
+
+@dataclass(slots=True, frozen=True)
+class IssueExample:
+    """An example issue shown by show_common_issues()."""
+    title: str
+    description: str
+    severity: str
+    example: str
+
 
 def demonstrate_validator():
     """Demonstrate the validator capabilities."""
@@ -22,9 +47,8 @@ def demonstrate_validator():
     print("=" * 50)
     print()
     
-    # Initialize validator - go up from tests/validator to backend
-    project_root = Path(__file__).parent.parent.parent
-    validator = FastAPIModelValidator(project_root)
+    # Initialize validator
+    validator = FastAPIModelValidator(PROJECT_ROOT)
     
     # Run validation
     print("🔍 Running validation...")
@@ -42,7 +66,6 @@ def demonstrate_validator():
     
     # Generate detailed report
     text_report = validator.generate_report("text")
-    json_report = validator.generate_report("json")
     
     print("📄 Text Report:")
     print("-" * 15)
@@ -51,8 +74,8 @@ def demonstrate_validator():
     
     # Save JSON report
     json_file = Path("validation_report.json")
-    with open(json_file, 'w') as f:
-        f.write(json_report)
+    with open(json_file, 'wb', buffering=1 << 20) as f:
+        validator.generate_report("json", fp=f)
     print(f"💾 JSON report saved to: {json_file}")
     
     # Show issue breakdown
@@ -60,29 +83,18 @@ def demonstrate_validator():
         print("\n🔍 Issue Analysis:")
         print("-" * 17)
         
-        severity_groups = {}
-        category_groups = {}
-        
-        for issue in issues:
-            # Group by severity
-            if issue.severity not in severity_groups:
-                severity_groups[issue.severity] = []
-            severity_groups[issue.severity].append(issue)
-            
-            # Group by category
-            if issue.category not in category_groups:
-                category_groups[issue.category] = []
-            category_groups[issue.category].append(issue)
+        severity_counts = Counter(issue.severity for issue in issues)
+        category_counts = Counter(issue.category for issue in issues)
         
         print("By Severity:")
-        for severity in Severity:
-            count = len(severity_groups.get(severity, []))
+        for severity in SEVERITY_ORDER:
+            count = severity_counts[severity]
             if count > 0:
                 print(f"  {severity.value}: {count}")
         
         print("\nBy Category:")
-        for category, issues_list in category_groups.items():
-            print(f"  {category.replace('_', ' ').title()}: {len(issues_list)}")
+        for category, count in category_counts.items():
+            print(f"  {category.replace('_', ' ').title()}: {count}")
     
     return len([i for i in issues if i.severity.value in ["CRITICAL", "HIGH"]])
 
@@ -93,12 +105,12 @@ def show_common_issues():
     print("\n🚨 Common Issues the Validator Detects:")
     print("=" * 45)
     
-    examples = [
-        {
-            "title": "Type Mismatch",
-            "description": "SQLAlchemy uses Integer, Pydantic uses str",
-            "severity": "CRITICAL",
-            "example": """
+    examples = (
+        IssueExample(
+            title="Type Mismatch",
+            description="SQLAlchemy uses Integer, Pydantic uses str",
+            severity="CRITICAL",
+            example="""
             # SQLAlchemy Model
             class User(Base):
                 age: Mapped[int] = mapped_column(Integer)
@@ -107,12 +119,12 @@ def show_common_issues():
             class UserSchema(BaseModel):
                 age: str  # ❌ Should be int
             """
-        },
-        {
-            "title": "Missing Field",
-            "description": "Field exists in one model but not the other",
-            "severity": "HIGH",
-            "example": """
+        ),
+        IssueExample(
+            title="Missing Field",
+            description="Field exists in one model but not the other",
+            severity="HIGH",
+            example="""
             # SQLAlchemy Model
             class User(Base):
                 name: Mapped[str] = mapped_column(String(255))
@@ -123,12 +135,12 @@ def show_common_issues():
                 name: str
                 # ❌ Missing email field
             """
-        },
-        {
-            "title": "Nullable Mismatch",
-            "description": "SQLAlchemy nullable doesn't match Pydantic optional",
-            "severity": "HIGH", 
-            "example": """
+        ),
+        IssueExample(
+            title="Nullable Mismatch",
+            description="SQLAlchemy nullable doesn't match Pydantic optional",
+            severity="HIGH", 
+            example="""
             # SQLAlchemy Model
             class User(Base):
                 bio: Mapped[str] = mapped_column(String(500), nullable=True)
@@ -137,12 +149,12 @@ def show_common_issues():
             class UserSchema(BaseModel):
                 bio: str  # ❌ Should be Optional[str]
             """
-        },
-        {
-            "title": "Constraint Mismatch",
-            "description": "String length or other constraints don't match",
-            "severity": "MEDIUM",
-            "example": """
+        ),
+        IssueExample(
+            title="Constraint Mismatch",
+            description="String length or other constraints don't match",
+            severity="MEDIUM",
+            example="""
             # SQLAlchemy Model
             class User(Base):
                 name: Mapped[str] = mapped_column(String(100))
@@ -151,33 +163,25 @@ def show_common_issues():
             class UserSchema(BaseModel):
                 name: str = Field(max_length=255)  # ❌ Different max length
             """
-        },
-        {
-            "title": "Missing Pydantic Schemas",
-            "description": "SQLAlchemy model without corresponding Pydantic schemas", 
-            "severity": "INFO",
-            "example": """
+        ),
+        IssueExample(
+            title="Missing Pydantic Schemas",
+            description="SQLAlchemy model without corresponding Pydantic schemas", 
+            severity="INFO",
+            example="""
             # SQLAlchemy Model exists
             class Product(Base):
                 name: Mapped[str] = mapped_column(String(255))
             
             # ❌ No ProductBase, ProductCreate, ProductUpdate schemas found
             """
-        }
-    ]
+        )
+    )
     
     for i, example in enumerate(examples, 1):
-        severity_icon = {
-            "CRITICAL": "🔴",
-            "HIGH": "🟠", 
-            "MEDIUM": "🟡",
-            "LOW": "🔵",
-            "INFO": "ℹ️"
-        }[example["severity"]]
-        
-        print(f"{i}. {severity_icon} {example['title']} ({example['severity']})")
-        print(f"   {example['description']}")
-        print(f"   Example:{example['example']}")
+        print(f"{i}. {SEVERITY_ICON[example.severity]} {example.title} ({example.severity})")
+        print(f"   {example.description}")
+        print(f"   Example:{example.example}")
         print()
 
 
@@ -212,9 +216,11 @@ def main():
     # Run the actual validator
     critical_count = demonstrate_validator()
     
-    # Show educational content
-    show_common_issues()
-    show_best_practices()
+    # Show educational content only to a person at a terminal; in CI or
+    # when piped it would just bury the validator output
+    if sys.stdout.isatty():
+        show_common_issues()
+        show_best_practices()
     
     print("🎯 Integration Tips:")
     print("=" * 18)